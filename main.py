@@ -7,12 +7,13 @@ import curses
 from collections.abc import Callable
 from curses import panel
 import os
+import stat
 from abc import ABC, abstractmethod
-import glob
 from dataclasses import dataclass
-from random import randint
 import argparse
-from pathlib import Path
+import string
+import sys
+import time
 
 
 # Exception Handling
@@ -45,11 +46,80 @@ class InvalidFileException(Exception):
         self.message: str = message
 
 
+# Constants
+
+
+# Converts a timetable name into a lowercase filename in a single pass, replacing unsafe characters
+FILENAME_TABLE: dict[int, int] = str.maketrans(string.ascii_uppercase + " /\\:",
+                                               string.ascii_lowercase + "____")
+
+# Keys that can be typed into a text field, from space to tilde (see an ascii chart for context)
+PRINTABLE_KEYS: frozenset[int] = frozenset(range(ord(' '), ord('~') + 1))
+
+# Keys that can be typed into a timetable name, without "/" as it is an illegal character in unix filenames
+TIMETABLE_NAME_KEYS: frozenset[int] = PRINTABLE_KEYS - {ord('/')}
+
+# Keys that can be typed into a time field
+DIGIT_KEYS: frozenset[int] = frozenset(range(ord('0'), ord('9') + 1))
+
+# Keys that can be typed into the number of periods per day field
+PERIOD_COUNT_KEYS: frozenset[int] = frozenset(range(ord('3'), ord('6') + 1))
+
+# Keys that select the highlighted list item
+ENTER_KEYS: frozenset[int] = frozenset((curses.KEY_ENTER, ord("\n")))
+
+# Keys that delete the last character of a text field
+BACKSPACE_KEYS: frozenset[int] = frozenset((curses.KEY_BACKSPACE, 127))
+
+# Shortcut keys, matched in either case
+QUIT_KEYS: frozenset[int] = frozenset((ord("q"), ord("Q")))
+SAVE_KEYS: frozenset[int] = frozenset((ord("s"), ord("S")))
+EDIT_KEYS: frozenset[int] = frozenset((ord("e"), ord("E")))
+YES_KEYS: frozenset[int] = frozenset((ord("y"), ord("Y")))
+NO_KEYS: frozenset[int] = frozenset((ord("n"), ord("N")))
+
+# How far each arrow key moves the selection around the timetable, as (day, period)
+TIMETABLE_NAVIGATION_KEYS: dict[int, tuple[int, int]] = {
+    curses.KEY_UP: (0, -1),
+    curses.KEY_DOWN: (0, 1),
+    curses.KEY_LEFT: (-1, 0),
+    curses.KEY_RIGHT: (1, 0)
+}
+
+# The input buffer used by each field of the subject editor
+SUBJECT_FIELD_BUFFERS: dict[str, int] = {
+    "name": 0,
+    "teacher": 1
+}
+
+# How far each navigation key moves the selection in a list
+LIST_NAVIGATION_KEYS: dict[int, int] = {
+    curses.KEY_UP: -1,
+    curses.KEY_DOWN: 1
+}
+
+# Marks the item that closes a quick list menu, compared by identity so no item can be mistaken for it
+EXIT_ITEM: object = object()
+
+
+# Color Attributes
+# Cached once the color pairs are initialized, as they are used on every draw.
+
+
+CP_NORMAL: int = 0
+CP_BACKGROUND: int = 0
+CP_HIGHLIGHT: int = 0
+CP_HEADER: int = 0
+
+# The selected row of a list, reversed from the normal colors
+CP_SELECTED: int = 0
+
+
 # Data Structures
 # Allows for much clearer type hints, and easier to work with than dictionaries.
 
 
-@dataclass
+@dataclass(slots=True)
 class Subject:
     """
     Class for each unique subject.
@@ -65,7 +135,7 @@ class Subject:
         return f"{self.name} | {self.teacher}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Period:
     """
     Class for a period during the day, has a subject and room.
@@ -80,7 +150,7 @@ class Period:
         return f"Subject: {self.subject}, Room: {self.room}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PeriodTimeStruct:
     """
     Class for defining period times and names.
@@ -105,6 +175,10 @@ class Timetable:
 
     A dictionary of all period times
     """
+
+    __slots__ = ("periods", "subjects", "period_times", "name", "filename", "period_ids", "period_rows",
+                 "changes", "saved_changes")
+
     def __init__(self, periods: dict[int, dict[str, Period]],
                  subjects: dict[str, Subject],
                  period_times: dict[str, PeriodTimeStruct],
@@ -127,6 +201,26 @@ class Timetable:
         self.name: str = name
         self.filename: str = filename
 
+        # The period IDs in order, and the row of each, shared by every menu that displays the timetable
+        self.period_ids: list[str] = []
+        self.period_rows: dict[str, int] = {}
+
+        # The number of edits made, and how many had been made when it was last saved
+        self.changes: int = 0
+        self.saved_changes: int | None = None
+
+        self.index_period_times()
+
+    def index_period_times(self) -> None:
+        """
+        Records the order of the period times. Needs calling again if the period times are changed.
+
+        :return None:
+        """
+
+        self.period_ids = list(self.period_times)
+        self.period_rows = {period_id: row for row, period_id in enumerate(self.period_ids)}
+
     def save_file(self) -> None:
         """
         Saves the timetable to a file.
@@ -134,52 +228,70 @@ class Timetable:
         :return None:
         """
 
-        json_data: dict = {}
+        # Nothing has changed since the last save, so the file is already up to date
+        if self.changes == self.saved_changes and os.path.exists(self.filename):
+            return
+
+        # Converts all periods, subjects and period times into the Python dicts and lists that will get turned into JSON
+        json_data: dict = {
+            "name": self.name,
+            "timetable": [
+                {period_index: {"subject": period.subject.subject_id, "room": period.room}
+                 for period_index, period in day.items()}
+                for day in self.periods.values()
+            ],
+            "subjects": {
+                subject_index: {"name": subject.name, "teacher": subject.teacher}
+                for subject_index, subject in self.subjects.items()
+            },
+            "period_times": {
+                period_times_index: {"name": period_times.name,
+                                     "start": period_times.start_time,
+                                     "end": period_times.end_time}
+                for period_times_index, period_times in self.period_times.items()
+            }
+        }
 
-        # The raw Python data structures consisting of dictionaries and lists, that will get turned into JSON
-        timetable_raw: list[dict[str, dict[str, str]]] = []
-        subjects_raw: dict[str, dict[str, str]] = {}
-        period_times_raw: dict[str, dict[str, str]] = {}
+        # Turns said dict into compact JSON, as indenting makes the json module use its slower pure Python encoder
+        json_object: bytes = json.dumps(json_data, separators=(",", ":"), ensure_ascii=False).encode()
 
-        # Converts all periods into Python dicts
-        for day in self.periods.values():
-            day_data: dict[str, dict[str, str]] = {}
+        # Writes JSON data to a temporary file, then swaps it in so a failed save can't corrupt the file
+        # If the file is a symlink, the file it links to is replaced rather than the link itself
+        target_filename: str = os.path.realpath(self.filename)
+        temp_filename: str = f"{target_filename}.tmp"
+        fd: int = os.open(temp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
 
-            for period_index, period in day.items():
-                subject_id: str = period.subject.subject_id
-                room: str = period.room
+        try:
+            try:
+                # Keeps the permissions of the file being replaced
+                try:
+                    os.fchmod(fd, stat.S_IMODE(os.stat(target_filename).st_mode))
 
-                day_data[period_index] = {"subject": subject_id, "room": room}
+                except FileNotFoundError:
+                    pass
 
-            timetable_raw.append(day_data)
+                # A single write can be cut short, so keeps writing the rest until all the data is written
+                unwritten: memoryview = memoryview(json_object)
 
-        # Converts all subjects into Python dicts
-        for subject_index, subject in self.subjects.items():
-            name: str = subject.name
-            teacher: str = subject.teacher
+                while unwritten:
+                    unwritten = unwritten[os.write(fd, unwritten):]
 
-            subjects_raw[subject_index] = {"name": name, "teacher": teacher}
+            finally:
+                os.close(fd)
 
-        # Converts all period times into Python dicts
-        for period_times_index, period_times in self.period_times.items():
-            name: str = period_times.name
-            start_time: str = period_times.start_time
-            end_time: str = period_times.end_time
+            os.replace(temp_filename, target_filename)
 
-            period_times_raw[period_times_index] = {"name": name, "start": start_time, "end": end_time}
+        # Doesn't leave a partly written temporary file behind in the data directory
+        except OSError:
+            try:
+                os.unlink(temp_filename)
 
-        # Adds all data to one dict
-        json_data["name"] = self.name
-        json_data["timetable"] = timetable_raw
-        json_data["subjects"] = subjects_raw
-        json_data["period_times"] = period_times_raw
+            except FileNotFoundError:
+                pass
 
-        # Turns said dict into JSON
-        json_object = json.dumps(json_data, indent=4)
+            raise
 
-        # Writes JSON data to file
-        with open(self.filename, "w") as outfile:
-            outfile.write(json_object)
+        self.saved_changes = self.changes
 
 
 # Windows
@@ -212,13 +324,13 @@ class ContentWindow(ABC):
 
         # Separate window for the border
         self.border_window = parent.subwin(height, width, self.y_pos, self.x_pos)
-        self.border_window.bkgd(' ', curses.color_pair(1))
+        self.border_window.bkgd(' ', CP_NORMAL)
         self.border_window.border(0)
-        self.border_window.refresh()
+        self.border_window.noutrefresh()
 
         # Main window for all content
         self.window = parent.subwin(height - 2, width - 2, self.y_pos + 1, self.x_pos + 1)
-        self.window.bkgd(' ', curses.color_pair(1))
+        self.window.bkgd(' ', CP_NORMAL)
 
     @abstractmethod
     def display(self) -> None:
@@ -261,27 +373,43 @@ class PeriodWindow(ContentWindow):
         self.x_index: int = x_index
         self.y_index: int = y_index
 
+        # The selection state the backgrounds were last set for
+        self.last_selected: bool | None = None
+
     def display(self, selected: bool = False) -> None:
         self.window.erase()
 
-        # Checks if the window is being selected by the user
-        if selected:
-            self.window.bkgd(' ', curses.color_pair(3))
-            self.border_window.bkgd(' ', curses.color_pair(3))
+        # Only change the backgrounds when the window is selected or deselected by the user
+        if selected != self.last_selected:
+            if selected:
+                self.window.bkgd(' ', CP_HIGHLIGHT)
+                self.border_window.bkgd(' ', CP_HIGHLIGHT)
 
-        else:
-            self.window.bkgd(' ', curses.color_pair(1))
-            self.border_window.bkgd(' ', curses.color_pair(1))
+            else:
+                self.window.bkgd(' ', CP_NORMAL)
+                self.border_window.bkgd(' ', CP_NORMAL)
 
-        # Adds all info
-        self.window.addstr(0, 1, self.period.subject.name)
-        self.window.addstr(1, 1, self.period.subject.teacher)
-        self.window.addstr(2, 1, self.period.room)
-        self.window.refresh()
+            self.last_selected = selected
+
+        # Adds all info, cut off at the edge of the window so long names can't wrap onto the next line
+        text_width: int = self.width - 3
+
+        self.window.addnstr(0, 1, self.period.subject.name, text_width)
+        self.window.addnstr(1, 1, self.period.subject.teacher, text_width)
+
+        # A room reaching the bottom right corner is still drawn, but curses reports an error as the cursor can't
+        # move past the end of the window
+        try:
+            self.window.addnstr(2, 1, self.period.room, text_width)
+
+        except curses.error:
+            pass
+
+        self.window.noutrefresh()
 
         # Refreshes the border window for colors to change
         self.border_window.border(0)
-        self.border_window.refresh()
+        self.border_window.noutrefresh()
 
 
 class PeriodTimeWindow(ContentWindow):
@@ -300,15 +428,24 @@ class PeriodTimeWindow(ContentWindow):
     def display(self) -> None:
         self.window.erase()
 
-        # Displays all info
-        self.window.addstr(0, 1, self.period_times.name)
-        self.window.addstr(1, 1, self.period_times.start_time)
-        self.window.addstr(2, 1, self.period_times.end_time)
+        # Displays all info, cut off at the edge of the window so a long name can't push the times down
+        text_width: int = self.width - 3
 
-        self.window.refresh()
+        self.window.addnstr(0, 1, self.period_times.name, text_width)
+        self.window.addnstr(1, 1, self.period_times.start_time, text_width)
+
+        # An end time reaching the bottom right corner is still drawn, but curses reports an error as the cursor can't
+        # move past the end of the window
+        try:
+            self.window.addnstr(2, 1, self.period_times.end_time, text_width)
+
+        except curses.error:
+            pass
+
+        self.window.noutrefresh()
 
         self.border_window.border(0)
-        self.border_window.refresh()
+        self.border_window.noutrefresh()
 
 
 class TempPopupWindow(ContentWindow):
@@ -379,22 +516,22 @@ class Menu(ABC):
 
         # A separate window for displaying a black shadow behind the window.
         self.shadow_window = stdscreen.subwin(height + 2, width + 2, self.y_pos, self.x_pos)
-        self.shadow_window.bkgd(' ', curses.color_pair(3))
-        self.shadow_window.refresh()
+        self.shadow_window.bkgd(' ', CP_HIGHLIGHT)
+        self.shadow_window.noutrefresh()
 
         # A separate window for displaying a border and header.
         self.border_window = stdscreen.subwin(height + 2, width + 2, self.y_pos - 1, self.x_pos - 1)
-        self.border_window.bkgd(' ', curses.color_pair(1))
+        self.border_window.bkgd(' ', CP_NORMAL)
         self.border_window.border(0)
         self.border_window.addstr(0, (self.width - len(header)) // 2 - 1, "┤")
         self.border_window.addstr(0, (self.width + len(header)) // 2 + 2, "├")
-        self.border_window.addstr(0, (self.width - len(header)) // 2, f" {header} ", curses.color_pair(4))
-        self.border_window.refresh()
+        self.border_window.addstr(0, (self.width - len(header)) // 2, f" {header} ", CP_HEADER)
+        self.border_window.noutrefresh()
 
         # The main window for content to be displayed on
         self.window = stdscreen.subwin(height, width, self.y_pos, self.x_pos)
         self.window.keypad(True)
-        self.window.bkgd(' ', curses.color_pair(1))
+        self.window.bkgd(' ', CP_NORMAL)
 
         # Attributes used for displaying a navigable list on screen
         self.selected_list_item: int = 0
@@ -406,10 +543,23 @@ class Menu(ABC):
         # Used to disable shortcuts when the user is editing text
         self.editing: bool = False
 
-    def display_list(self) -> None:
+        # Used to skip redrawing the menu when nothing on it has changed
+        self.dirty: bool = True
+
+        # The rows of the list on screen, so only changed rows are redrawn. None when it must be drawn in full
+        self.drawn_rows: list[tuple[str, bool]] | None = None
+
+        # The most keys to process between redraws when they are typed or pasted faster than they can be drawn
+        self.max_pending_keys: int = 32
+
+        # The longest time in seconds to spend on waiting keys before redrawing, so the screen keeps up at 60fps
+        self.frame_time: float = 1 / 60
+
+    def display_list(self, batched: bool = False) -> None:
         """
         Displays a navigable list of items on screen.
 
+        :param batched: Whether to draw every item in a single call, then highlight the selected item.
         :return:
         """
 
@@ -421,14 +571,56 @@ class Menu(ABC):
 
         # Shorten the list to only display less than the maximum number of items, starting at the top item
         display_list: list[tuple] = self.list_items[self.top_list_item:self.top_list_item + self.max_list_items]
+        selected_index: int = self.selected_list_item - self.top_list_item
 
         # Displays the list on screen
-        for index, item in enumerate(display_list):
-            if index + self.top_list_item == self.selected_list_item:
-                self.window.addstr(index + 2, 1, f"› {item[0]} ", curses.A_REVERSE)
+        if batched:
+            # Each line starts at column 0 after a newline, so is padded by a space to line up with the other lists
+            # Long rows are cut off at the same width as when drawn row by row, so they can't wrap onto the next line
+            row_width: int = self.width - 2
 
-            else:
-                self.window.addstr(index + 2, 1, item[0])
+            self.window.addstr(2, 0, "\n".join((f" › {item[0]} " if index == selected_index else f" {item[0]}")
+                                                [:row_width + 1]
+                                                for index, item in enumerate(display_list)))
+            self.window.chgat(selected_index + 2, 1, min(len(display_list[selected_index][0]) + 3, row_width),
+                              CP_SELECTED)
+
+            self.drawn_rows = None
+
+        else:
+            # The text of each row, and whether it is selected
+            rows: list[tuple[str, bool]] = [
+                (f"› {item[0]} ", True) if index == selected_index else (item[0], False)
+                for index, item in enumerate(display_list)
+            ]
+
+            # Looked up once, as they are used for every row
+            window = self.window
+            drawn_rows: list[tuple[str, bool]] = self.drawn_rows or []
+            row_width: int = self.width - 2
+
+            # Only redraws rows that have changed since the list was last drawn
+            for index, row in enumerate(rows):
+                if index < len(drawn_rows) and drawn_rows[index] == row:
+                    continue
+
+                window.move(index + 2, 1)
+                window.clrtoeol()
+                # Long rows, such as subject names loaded from a file, are cut off at the edge of the window
+                window.addnstr(index + 2, 1, row[0], row_width, curses.A_REVERSE if row[1] else curses.A_NORMAL)
+
+            if self.drawn_rows is not None:
+                # Clears the rows left over from a previous, longer list
+                for index in range(len(rows), len(drawn_rows)):
+                    window.move(index + 2, 1)
+                    window.clrtoeol()
+
+                # Clears the indicators for cut off items, which are drawn again below if still needed
+                for y in [1, self.max_list_items + 2]:
+                    window.move(y, 1)
+                    window.clrtoeol()
+
+            self.drawn_rows = rows
 
         # Check if there are additional list items that have been cut off
         if self.top_list_item > 0:
@@ -445,13 +637,9 @@ class Menu(ABC):
         :return:
         """
 
-        self.selected_list_item += change
-
-        if self.selected_list_item < 0:
-            self.selected_list_item = 0
-
-        elif self.selected_list_item >= len(self.list_items):
-            self.selected_list_item = len(self.list_items) - 1
+        # Keeps the selection within the list
+        self.selected_list_item = max(0, min(self.selected_list_item + change, len(self.list_items) - 1))
+        self.dirty = True
 
         # Get the position relative to the top displayed element, and adjust if necessary
         relative_pos: int = self.selected_list_item - self.top_list_item
@@ -462,6 +650,57 @@ class Menu(ABC):
         elif relative_pos < 0:
             self.top_list_item = self.selected_list_item
 
+    def process_pending_input(self, state: int, selected_list_item: int) -> None:
+        """
+        Processes any keys that are already waiting, such as pasted text, without redrawing in between.
+
+        Stops once the state or selected item changes, as the list items need to be rebuilt before more input.
+        Also stops once a frame's worth of time has passed, so the screen is still updated during long pastes.
+        Used by the menus with states, which handle each key in their process_input method.
+
+        :param state: The state before the last key was processed.
+        :param selected_list_item: The selected list item before the last key was processed.
+        :return:
+        """
+
+        # The last key changed what is on screen, so it needs redrawing before any more keys are processed
+        if self.state == -1 or self.state != state or self.selected_list_item != selected_list_item:
+            return
+
+        frame_end: float = time.monotonic() + self.frame_time
+
+        self.window.nodelay(True)
+
+        try:
+            for _ in range(self.max_pending_keys):
+                if self.state != state or self.selected_list_item != selected_list_item:
+                    break
+
+                # Leaves the rest of the keys for after the next redraw
+                if time.monotonic() > frame_end:
+                    break
+
+                key = self.window.getch()
+
+                # No more keys waiting
+                if key == -1:
+                    break
+
+                self.process_input(key)
+
+        finally:
+            self.window.nodelay(False)
+
+    def redraw(self) -> None:
+        """
+        Marks the whole menu to be cleared and redrawn, rather than only the rows that have changed.
+
+        :return None:
+        """
+
+        self.dirty = True
+        self.drawn_rows = None
+
     def exit(self) -> None:
         """
         Used before exiting the menu, clears the window to prepare for exiting.
@@ -472,6 +711,9 @@ class Menu(ABC):
         self.window.clear()
         curses.doupdate()
 
+        # The window has been cleared, so the menu is drawn in full if it is displayed again
+        self.redraw()
+
     @abstractmethod
     def display(self) -> None:
         """
@@ -495,8 +737,8 @@ class QuickListMenu(Menu):
         self.panel.hide()
         panel.update_panels()
 
-        self.list_items = items
-        self.list_items.append(("Exit", "Exit"))
+        # Copies the items, so the exit item isn't added to the caller's list
+        self.list_items = [*items, ("Exit", EXIT_ITEM)]
 
         self.shortcut_info = "Shortcuts: [esc] Back, [q] Quit, [return] Select"
 
@@ -506,7 +748,10 @@ class QuickListMenu(Menu):
         self.window.clear()
 
         while True:
-            self.window.erase()
+            # Only clears the window when everything needs redrawing, otherwise only changed rows are drawn over
+            if self.drawn_rows is None:
+                self.window.erase()
+
             self.display_list()
             self.window.addstr(self.height - 1, 2, self.shortcut_info)
             self.window.addstr(0, 2, self.title)
@@ -514,22 +759,27 @@ class QuickListMenu(Menu):
 
             key = self.window.getch()
 
+            item: tuple = self.list_items[self.selected_list_item]
+
             # Check if the user has pressed enter to select an item
-            if key in [curses.KEY_ENTER, ord("\n")]:
-                if self.list_items[self.selected_list_item][1] == "Exit":
+            if key in ENTER_KEYS:
+                if item[1] is EXIT_ITEM:
                     self.exit()
                     return
 
                 # Check if the second item in the tuple is a function, if so call it with parameters
-                elif isinstance(self.list_items[self.selected_list_item][1], Callable):
-                    if len(self.list_items[self.selected_list_item]) <= 2:
-                        self.list_items[self.selected_list_item][1]()
+                elif isinstance(item[1], Callable):
+                    if len(item) <= 2:
+                        item[1]()
 
                     else:
-                        self.list_items[self.selected_list_item][1](*self.list_items[self.selected_list_item][2:])
+                        item[1](*item[2:])
+
+                    # The selected menu has been drawn over this one
+                    self.redraw()
 
             # Exit the program
-            elif key == ord("q"):
+            elif key in QUIT_KEYS:
                 raise ExitCurses("Exiting")
 
             # Escape key
@@ -538,11 +788,11 @@ class QuickListMenu(Menu):
                 return
 
             # Navigate the list
-            elif key == curses.KEY_UP:
-                self.navigate_list(-1)
+            elif key in LIST_NAVIGATION_KEYS:
+                self.navigate_list(LIST_NAVIGATION_KEYS[key])
 
-            elif key == curses.KEY_DOWN:
-                self.navigate_list(1)
+            elif key == curses.KEY_RESIZE:
+                self.redraw()
 
 
 class TimetableMenu(Menu):
@@ -580,6 +830,21 @@ class TimetableMenu(Menu):
 
         self.state: int = 0
 
+        # Input and display methods for each state
+        self.input_handlers: dict[int, Callable[[int], None]] = {
+            0: self.process_input_viewing,
+            1: self.process_input_editing,
+            2: self.process_input_editing_period,
+            3: self.process_input_selecting_subject
+        }
+
+        self.display_handlers: dict[int, Callable[[], None]] = {
+            0: self.display_viewing,
+            1: self.display_editing,
+            2: self.display_editing_period,
+            3: self.display_selecting_subject
+        }
+
         self.panel = panel.new_panel(self.window)
         self.panel.hide()
         panel.update_panels()
@@ -591,7 +856,10 @@ class TimetableMenu(Menu):
         self.shortcut_info: str = "Shortcuts: [esc] Back, [q] Quit, [s] Save Timetable, [return] Select"
 
         # Windows for periods and period times
-        self.period_windows: list[PeriodWindow] = []
+        self.period_windows: dict[tuple[int, int], PeriodWindow] = {}
+
+        # Windows of deleted periods, reused if a period is added in the same place
+        self.spare_period_windows: dict[tuple[int, int], PeriodWindow] = {}
         self.period_time_windows: list[PeriodTimeWindow] = []
 
         # More info for displaying windows
@@ -601,20 +869,44 @@ class TimetableMenu(Menu):
         self.period_height: int = 5
         self.period_width: int = (self.width - self.period_times_window_width - 2 * self.margin) // 5
 
+        # The x position of each day's header, which only depends on the layout
+        self.day_headers: list[tuple[int, str]] = [
+            (self.margin + i * self.period_width + self.period_times_window_width + 2, day)
+            for i, day in enumerate(self.days)
+        ]
+
         self.cell_x_count: int = 5
         self.cell_y_count: int = len(self.timetable.period_times)
 
+        # The screen position of each day's column and each period's row, shared by every window in them
+        self.column_x: list[int] = [
+            self.x_pos + self.margin + self.period_times_window_width + i * self.period_width
+            for i in range(self.cell_x_count)
+        ]
+        self.row_y: list[int] = [self.y_pos + self.margin + i * self.period_height for i in range(self.cell_y_count)]
+
         self.selected_period_x: int = 0
         self.selected_period_y: int = 0
 
+        # The period highlighted on screen, so moving the selection only redraws the two periods that changed
+        self.drawn_highlight: tuple[int, int] | None = None
+
         # Used to edit the selected period or subject
         self.selected_period: Period | None = None
         self.selected_subject: Subject | None = None
 
-        # Input handling
-        self.input_buffer: str = ""
+        # List of subjects to select from, built the first time it is displayed
+        self.subject_list_items: list[tuple] | None = None
+
+        # Input handling, stored as a list of characters so typed characters can be appended in place
+        # Characters rather than bytes, as rooms loaded from a file may contain non-ASCII characters
+        self.input_buffer: list[str] = []
         self.max_input_size: int = 20
 
+        # The windows are built once, then only redrawn
+        self.create_period_windows()
+        self.create_period_time_windows()
+
     def create_period_windows(self) -> None:
         """
         Creates the windows used to display the periods.
@@ -622,21 +914,62 @@ class TimetableMenu(Menu):
         :return:
         """
 
-        self.period_windows = []
+        self.period_windows = {}
+
+        # Values that are the same for every window, so only need to be looked up once
+        column_x: list[int] = self.column_x
+        row_y: list[int] = self.row_y
+        period_width: int = self.period_width
+        period_height: int = self.period_height
+        parent = self.window
+        period_rows: dict[str, int] = self.timetable.period_rows
 
         for day_num, day in self.timetable.periods.items():
+            # Only the days shown on screen get windows, other days in a loaded file are kept but not displayed
+            if day_num >= self.cell_x_count:
+                continue
+
             for period_id, period in day.items():
-                day_index = list(self.timetable.period_times.keys()).index(period_id)
+                day_index: int = period_rows[period_id]
+
+                period_window: PeriodWindow = PeriodWindow(period, period_width, period_height,
+                                                           column_x[day_num], row_y[day_index],
+                                                           day_num, day_index, parent)
+
+                self.period_windows[(day_num, day_index)] = period_window
+
+    def update_period_window(self, x_index: int, y_index: int) -> None:
+        """
+        Updates the window of a single period after it is edited, so the other windows don't need to be recreated.
+
+        :param x_index: The day index of the period.
+        :param y_index: The index of the period during the day.
+        :return:
+        """
+
+        period: Period | None = self.timetable.periods[x_index].get(self.timetable.period_ids[y_index])
+        period_window: PeriodWindow | None = self.period_windows.get((x_index, y_index))
+
+        # The period was deleted, its window is kept in case a period is added there again
+        if period is None:
+            if period_window is not None:
+                self.spare_period_windows[(x_index, y_index)] = self.period_windows.pop((x_index, y_index))
 
-                # Position of the new window
-                window_x = self.x_pos + self.margin + day_num * self.period_width + self.period_times_window_width
-                window_y = self.y_pos + self.margin + day_index * self.period_height
+        elif period_window is not None:
+            period_window.period = period
 
-                period_window: PeriodWindow = PeriodWindow(period, self.period_width, self.period_height,
-                                                           window_x, window_y,
-                                                           day_num, day_index, self.window)
+        # The period was added where one was deleted, so its old window can be reused
+        elif (x_index, y_index) in self.spare_period_windows:
+            period_window = self.spare_period_windows.pop((x_index, y_index))
+            period_window.period = period
 
-                self.period_windows.append(period_window)
+            self.period_windows[(x_index, y_index)] = period_window
+
+        # The period was added, so it needs a new window
+        else:
+            self.period_windows[(x_index, y_index)] = PeriodWindow(period, self.period_width, self.period_height,
+                                                                   self.column_x[x_index], self.row_y[y_index],
+                                                                   x_index, y_index, self.window)
 
     def create_period_time_windows(self) -> None:
         """
@@ -645,17 +978,16 @@ class TimetableMenu(Menu):
         :return:
         """
 
-        for index, period_data in enumerate(self.timetable.period_times.values()):
-            # Position of the new window
-            window_x: int = self.x_pos + self.margin
-            window_y: int = self.y_pos + self.margin + index * self.period_height
-
-            period_time_window: PeriodTimeWindow = PeriodTimeWindow(period_data, self.period_times_window_width,
-                                                                    self.period_height,
-                                                                    window_x, window_y,
-                                                                    self.window)
+        # Values that are the same for every window, so only need to be looked up once
+        window_x: int = self.x_pos + self.margin
+        window_width: int = self.period_times_window_width
+        period_height: int = self.period_height
+        parent = self.window
 
-            self.period_time_windows.append(period_time_window)
+        self.period_time_windows = [
+            PeriodTimeWindow(period_data, window_width, period_height, window_x, window_y, parent)
+            for window_y, period_data in zip(self.row_y, self.timetable.period_times.values())
+        ]
 
     def render_timetable(self, **kwargs) -> None:
         """
@@ -666,57 +998,81 @@ class TimetableMenu(Menu):
         """
 
         highlighted: tuple[int, int] | None = kwargs.get("highlighted")
-        selection_found: bool = False
-
-        # Render each period window
-        for period_window in self.period_windows:
-            if (highlighted is not None
-                    and highlighted[0] == period_window.x_index
-                    and highlighted[1] == period_window.y_index):
+        highlighted_window: PeriodWindow | None = None
 
-                period_window.display(True)
-                selection_found = True
+        if highlighted is not None:
+            highlighted_window = self.period_windows.get(highlighted)
 
-            else:
-                period_window.display()
+        # Render each period window
+        for period_window in self.period_windows.values():
+            period_window.display(period_window is highlighted_window)
 
         # If the highlighted window does not exist, display the option to create a new one at the selected position
-        if highlighted is not None and not selection_found:
-            window_x = self.margin + highlighted[0] * self.period_width + self.period_times_window_width + 1
-            window_y = self.margin + highlighted[1] * self.period_height + 1
+        if highlighted is not None and highlighted_window is None:
+            self.render_empty_period(highlighted, True)
 
-            self.window.addstr(window_y, window_x, "<Add New>", curses.color_pair(3))
+        self.drawn_highlight = highlighted
 
         # Display period time windows
         for period_time_window in self.period_time_windows:
             period_time_window.display()
 
-        for i, day in enumerate(self.days):
-            self.window.addstr(self.margin - 2, self.margin + i * self.period_width +
-                               self.period_times_window_width + 2, day,
-                               curses.color_pair(4))
+        for x, day in self.day_headers:
+            self.window.addstr(self.margin - 2, x, day, CP_HEADER)
 
-    def navigate_timetable(self, x_change: int, y_change: int) -> None:
-        self.selected_period_x += x_change
-        self.selected_period_y += y_change
+    def render_empty_period(self, position: tuple[int, int], selected: bool) -> None:
+        """
+        Renders the option to create a new period at a position with no period, or clears it once deselected.
 
-        # Ensure the selected period is within the boundaries of the timetable
-        if self.selected_period_x < 0:
-            self.selected_period_x = 0
+        :param position: The day and period index of the empty period.
+        :param selected: Whether the empty period is selected.
+        :return:
+        """
 
-        elif self.selected_period_x >= self.cell_x_count:
-            self.selected_period_x = self.cell_x_count - 1
+        window_x: int = self.margin + position[0] * self.period_width + self.period_times_window_width + 1
+        window_y: int = self.margin + position[1] * self.period_height + 1
 
-        if self.selected_period_y < 0:
-            self.selected_period_y = 0
+        if selected:
+            self.window.addstr(window_y, window_x, "<Add New>", CP_HIGHLIGHT)
 
-        elif self.selected_period_y >= self.cell_y_count:
-            self.selected_period_y = self.cell_y_count - 1
+        else:
+            self.window.addstr(window_y, window_x, " " * len("<Add New>"))
+
+    def render_highlight(self) -> None:
+        """
+        Moves the highlight to the selected period, only redrawing the previously and newly highlighted periods.
+
+        :return:
+        """
+
+        highlighted: tuple[int, int] = (self.selected_period_x, self.selected_period_y)
+
+        if highlighted == self.drawn_highlight:
+            return
+
+        for position, selected in ((self.drawn_highlight, False), (highlighted, True)):
+            if position is None:
+                continue
+
+            period_window: PeriodWindow | None = self.period_windows.get(position)
+
+            if period_window is not None:
+                period_window.display(selected)
+
+            else:
+                self.render_empty_period(position, selected)
+
+        self.drawn_highlight = highlighted
+
+    def navigate_timetable(self, x_change: int, y_change: int) -> None:
+        # Ensure the selected period is within the boundaries of the timetable
+        self.selected_period_x = max(0, min(self.selected_period_x + x_change, self.cell_x_count - 1))
+        self.selected_period_y = max(0, min(self.selected_period_y + y_change, self.cell_y_count - 1))
 
     # Input Processing
 
     def process_input_viewing(self, key: int) -> None:
-        if key == ord("e"):
+        if key in EDIT_KEYS:
             self.state = 1
 
         # Escape key
@@ -724,18 +1080,18 @@ class TimetableMenu(Menu):
             self.state = -1
 
     def process_input_editing(self, key: int) -> None:
-        if key in [curses.KEY_ENTER, ord("\n")]:
-            selected_period_id: str = list(self.timetable.period_times.keys())[self.selected_period_y]
+        if key in ENTER_KEYS:
+            selected_period_id: str = self.timetable.period_ids[self.selected_period_y]
             self.selected_period = self.timetable.periods[self.selected_period_x].get(selected_period_id)
 
             # Load the subject of the selected period
             if self.selected_period is not None:
                 self.selected_subject = self.selected_period.subject
-                self.input_buffer = self.selected_period.room
+                self.input_buffer = list(self.selected_period.room)
 
             else:
                 self.selected_subject = None
-                self.input_buffer = ""
+                self.input_buffer = []
 
             self.selected_list_item = 0
             self.state = 2
@@ -744,46 +1100,40 @@ class TimetableMenu(Menu):
         elif key == 27:
             self.state = 0
 
-        elif key == curses.KEY_UP:
-            self.navigate_timetable(0, -1)
-
-        elif key == curses.KEY_DOWN:
-            self.navigate_timetable(0, 1)
-
-        elif key == curses.KEY_LEFT:
-            self.navigate_timetable(-1, 0)
-
-        elif key == curses.KEY_RIGHT:
-            self.navigate_timetable(1, 0)
+        elif key in TIMETABLE_NAVIGATION_KEYS:
+            self.navigate_timetable(*TIMETABLE_NAVIGATION_KEYS[key])
 
     def process_input_editing_period(self, key: int) -> None:
-        if key in [curses.KEY_ENTER, ord("\n")]:
+        item: tuple = self.list_items[self.selected_list_item]
+
+        if key in ENTER_KEYS:
             # Select a subject
-            if self.list_items[self.selected_list_item][1] == "subject":
+            if item[1] == "subject":
                 self.selected_list_item = 0
 
                 self.state = 3
 
             # Delete the period
-            elif self.list_items[self.selected_list_item][1] == "delete":
-                period_id: str = list(self.timetable.period_times.keys())[self.selected_period_y]
+            elif item[1] == "delete":
+                period_id: str = self.timetable.period_ids[self.selected_period_y]
 
-                if self.timetable.periods[self.selected_period_x].get(period_id) is not None:
-                    del self.timetable.periods[self.selected_period_x][period_id]
+                if self.timetable.periods[self.selected_period_x].pop(period_id, None) is not None:
+                    self.timetable.changes += 1
 
-                self.create_period_windows()
+                self.update_period_window(self.selected_period_x, self.selected_period_y)
 
                 self.state = 1
 
             # Save the period ad exit
-            elif self.list_items[self.selected_list_item][1] == "save_exit":
+            elif item[1] == "save_exit":
                 if self.selected_subject is not None:
-                    period_id: str = list(self.timetable.period_times.keys())[self.selected_period_y]
-                    new_period = Period(self.selected_subject, self.input_buffer)
+                    period_id: str = self.timetable.period_ids[self.selected_period_y]
+                    new_period = Period(self.selected_subject, "".join(self.input_buffer))
 
                     self.timetable.periods[self.selected_period_x][period_id] = new_period
+                    self.timetable.changes += 1
 
-                    self.create_period_windows()
+                    self.update_period_window(self.selected_period_x, self.selected_period_y)
 
                     self.state = 1
 
@@ -792,7 +1142,7 @@ class TimetableMenu(Menu):
                     popup_window.display()
 
             # Exit without saving
-            elif self.list_items[self.selected_list_item][1] == "back":
+            elif item[1] == "back":
                 self.state = 1
 
         elif key == 27:
@@ -805,20 +1155,22 @@ class TimetableMenu(Menu):
         elif key == curses.KEY_DOWN:
             self.navigate_list(1)
 
-        elif self.list_items[self.selected_list_item][1] == "editor":
-            if (ord('!') <= key <= ord('~') or key == ord(' ')) and len(self.input_buffer) < self.max_input_size:
-                self.input_buffer += chr(key)
+        elif item[1] == "editor":
+            if key in PRINTABLE_KEYS and len(self.input_buffer) < self.max_input_size:
+                self.input_buffer.append(chr(key))
 
-            elif key in [curses.KEY_BACKSPACE, 127] and len(self.input_buffer) > 0:
-                self.input_buffer = self.input_buffer[:-1]
+            elif key in BACKSPACE_KEYS and len(self.input_buffer) > 0:
+                del self.input_buffer[-1]
 
     def process_input_selecting_subject(self, key: int) -> None:
-        if key in [curses.KEY_ENTER, ord("\n")]:
-            if self.list_items[self.selected_list_item][1] == "back":
+        item: tuple = self.list_items[self.selected_list_item]
+
+        if key in ENTER_KEYS:
+            if item[1] == "back":
                 self.state = 2
 
             else:
-                self.selected_subject = self.list_items[self.selected_list_item][1]
+                self.selected_subject = item[1]
 
                 self.state = 2
 
@@ -836,10 +1188,19 @@ class TimetableMenu(Menu):
             self.navigate_list(1)
 
     def process_input(self, key: int) -> None:
-        if key in [ord('q'), ord('Q')] and self.editing is False:
+        # Keys that can change the state, or draw a popup over the menu, redraw all of it
+        if key in ENTER_KEYS or key in EDIT_KEYS or key in SAVE_KEYS or key == 27 or key == curses.KEY_RESIZE:
+            self.redraw()
+
+        # Otherwise in the lists only the rows that have changed are redrawn, and other keys on the timetable only
+        # move the highlight
+        elif self.state >= 2:
+            self.dirty = True
+
+        if key in QUIT_KEYS and self.editing is False:
             raise ExitCurses("Exiting")
 
-        elif key in [ord('s'), ord('S')] and self.editing is False:
+        elif key in SAVE_KEYS and self.editing is False:
             self.timetable.save_file()
 
             saved_popup = TempPopupWindow("Successfully Saved Timetable", self.stdscreen)
@@ -847,21 +1208,13 @@ class TimetableMenu(Menu):
 
         else:
             # Process input based on state
-            if self.state == 0:
-                self.process_input_viewing(key)
-
-            elif self.state == 1:
-                self.process_input_editing(key)
+            input_handler: Callable[[int], None] | None = self.input_handlers.get(self.state)
 
-            elif self.state == 2:
-                self.process_input_editing_period(key)
-
-            elif self.state == 3:
-                self.process_input_selecting_subject(key)
-
-            else:
+            if input_handler is None:
                 raise ExitCurses("Invalid state")
 
+            input_handler(key)
+
     # Displaying Windows
 
     def display_viewing(self) -> None:
@@ -879,7 +1232,7 @@ class TimetableMenu(Menu):
 
         self.list_items = [
             (f"Subject: {self.selected_subject}", "subject"),
-            (f"Room: {self.input_buffer}", "editor"),
+            (f"Room: {''.join(self.input_buffer)}", "editor"),
             ("Delete", "delete"),
             ("Save and Exit", "save_exit"),
             ("Back", "back"),
@@ -890,59 +1243,61 @@ class TimetableMenu(Menu):
     def display_selecting_subject(self) -> None:
         self.shortcut_info = "Shortcuts: [esc] Back, [q] Quit, [s] Save Timetable, [return] Select"
 
-        self.list_items = []
+        # The subjects can't change while the timetable is open, so the list only needs building once
+        if self.subject_list_items is None:
+            self.subject_list_items = [(str(subject), subject) for subject in self.timetable.subjects.values()]
+            self.subject_list_items.append(("Back", "back"))
 
-        for subject in self.timetable.subjects.values():
-            self.list_items.append((str(subject), subject))
+        self.list_items = self.subject_list_items
 
-        self.list_items.append(("Back", "back"))
-
-        self.display_list()
+        self.display_list(batched=True)
 
     def display(self) -> None:
         self.panel.top()
         self.panel.show()
         self.window.clear()
 
-        if self.state == 0 or self.state == 1:
-            self.create_period_windows()
-            self.create_period_time_windows()
-
         while True:
-            self.window.clear()
-
             # Display State
 
             if self.state == -1:
                 self.exit()
                 return
 
-            if self.state == 0:
-                self.display_viewing()
+            if self.dirty:
+                # Clears the window when everything needs redrawing, otherwise only changed rows are drawn over
+                if self.drawn_rows is None:
+                    self.window.clear()
 
-            elif self.state == 1:
-                self.display_editing()
+                self.display_handlers[self.state]()
 
-            elif self.state == 2:
-                self.display_editing_period()
+                self.title = f"{self.states.get(self.state)} | {self.timetable.name}"
 
-            elif self.state == 3:
-                self.display_selecting_subject()
+                if self.editing:
+                    self.shortcut_info = "(Editing)"
 
-            self.title = f"{self.states.get(self.state)} | {self.timetable.name}"
+                for y, text in ((0, self.title), (self.height - 1, self.shortcut_info)):
+                    self.window.move(y, 2)
+                    self.window.clrtoeol()
+                    self.window.addstr(y, 2, text)
 
-            self.window.addstr(0, 2, self.title)
+                self.dirty = False
 
-            if self.editing:
-                self.shortcut_info = "(Editing)"
+            # Moving around the timetable only redraws the periods the highlight moved between
+            elif self.state == 1:
+                self.render_highlight()
 
-            self.window.addstr(self.height - 1, 2, self.shortcut_info)
-            self.window.refresh()
+            self.window.noutrefresh()
             curses.doupdate()
 
             key = self.window.getch()
 
+            # Keys waiting behind this one are only processed if it doesn't change the state or selected item
+            state: int = self.state
+            selected_list_item: int = self.selected_list_item
+
             self.process_input(key)
+            self.process_pending_input(state, selected_list_item)
 
 
 class TimetableCreatorMenu(Menu):
@@ -972,13 +1327,36 @@ class TimetableCreatorMenu(Menu):
 
         self.state: int = 0
 
+        # Input and display methods for each state
+        self.input_handlers: dict[int, Callable[[int], None]] = {
+            0: self.process_input_basic_info,
+            1: self.process_input_creating_period_times,
+            2: self.process_input_viewing_subjects,
+            3: self.process_input_editing_subject
+        }
+
+        self.display_handlers: dict[int, Callable[[], None]] = {
+            0: self.display_basic_info,
+            1: self.display_creating_period_times,
+            2: self.display_viewing_subjects,
+            3: self.display_editing_subject
+        }
+
+        # Methods that fill the input buffer with the fields of each state when it is entered
+        self.input_loaders: dict[int, Callable[[], None]] = {
+            0: self.load_basic_info_input,
+            1: self.load_period_times_input,
+            3: self.load_subject_input
+        }
+
         self.panel = panel.new_panel(self.window)
         self.panel.hide()
         panel.update_panels()
 
         self.shortcut_info: str = "Shortcuts: [esc] Back, [q] Quit, [return] Select"
 
-        self.input_buffer: list[str] = ["", ""]
+        # Input for each text field, stored as bytes so typed characters can be appended in place
+        self.input_buffer: list[bytearray] = [bytearray(), bytearray()]
         self.max_input_size: int = 20
 
         self.timetable_name: str = ""
@@ -993,15 +1371,18 @@ class TimetableCreatorMenu(Menu):
 
         self.subject_editing_id: str | None = None
 
+        # The ID given to the next new subject, counting up so IDs never collide
+        self.next_subject_id: int = 0
+
+        # Set when typing or a selection changes the list items, so they are rebuilt on the next draw
+        self.list_items_changed: bool = True
+
         self.timetable: Timetable | None = None
 
     def create_timetable(self) -> None:
-        periods: dict[int, dict[str, Period]] = {}
-
-        for i in range(6):
-            periods[i] = {}
+        periods: dict[int, dict[str, Period]] = {i: {} for i in range(6)}
 
-        filename: str = f"{data_dir}/{self.timetable_name.lower().replace(' ', '_')}.json"
+        filename: str = f"{data_dir}/{self.timetable_name.translate(FILENAME_TABLE)}.json"
 
         self.timetable = Timetable(periods, self.subjects, self.period_times, self.timetable_name, filename)
 
@@ -1015,148 +1396,170 @@ class TimetableCreatorMenu(Menu):
 
         for index in range(len(self.input_buffer) // 2):
             self.period_times[str(index)] = PeriodTimeStruct(f"Period {index + start_index}",
-                                                             self.input_buffer[index * 2],
-                                                             self.input_buffer[index * 2 + 1])
+                                                             self.input_buffer[index * 2].decode(),
+                                                             self.input_buffer[index * 2 + 1].decode())
 
-    # Input Processing
+    def enter_state(self, state: int) -> None:
+        """
+        Moves to the given state, starting at the top of its list with its fields loaded into the input buffer.
 
-    def process_input_basic_info(self, key: int) -> None:
-        if key in [curses.KEY_ENTER, ord("\n")]:
-            if self.list_items[self.selected_list_item][1] == "Back":
-                self.state = -1
+        :param state: The state to move to.
+        :return:
+        """
 
-            elif self.list_items[self.selected_list_item][1] == "Next":
-                if self.input_buffer[0] == "":
-                    popup_window = TempPopupWindow("Please enter a name for the timetable.", self.stdscreen)
-                    popup_window.display()
+        # Keeps any period times entered before leaving them
+        self.process_period_times()
 
-                elif self.input_buffer[1] == "":
-                    popup_window = TempPopupWindow("Please select the number of periods", self.stdscreen)
-                    popup_window.display()
+        self.input_buffer = []
+        self.selected_list_item = 0
+        self.top_list_item = 0
 
-                else:
-                    self.timetable_name = self.input_buffer[0]
-                    self.num_periods = int(self.input_buffer[1])
+        self.state = state
 
-                    self.input_buffer = []
+        input_loader: Callable[[], None] | None = self.input_loaders.get(state)
 
-                    for _ in range(self.num_periods):
-                        self.input_buffer.append("")
-                        self.input_buffer.append("")
+        if input_loader is not None:
+            input_loader()
 
-                    self.selected_list_item = 0
+    def load_basic_info_input(self) -> None:
+        self.input_buffer = [bytearray(self.timetable_name.encode()), bytearray(str(self.num_periods).encode())]
 
-                    self.state = 1
+    def load_subject_input(self) -> None:
+        """
+        Fills the input buffer with the subject being edited, or starts with empty fields for a new subject.
 
-        elif key == 27:
-            self.state = -1
+        :return:
+        """
 
-        elif key == curses.KEY_UP:
-            self.navigate_list(-1)
+        subject: Subject | None = self.subjects.get(self.subject_editing_id)
 
-        elif key == curses.KEY_DOWN:
-            self.navigate_list(1)
+        if subject is None:
+            self.input_buffer = [bytearray(), bytearray()]
 
-        elif self.list_items[self.selected_list_item][1] == "editor":
-            if self.list_items[self.selected_list_item][2] == "name":
-                if ((ord('!') <= key <= ord('~') or key == ord(' ')) and  # See an ascii chart for context
-                        key != ord('/') and  # Illegal character in unix filenames so must be filtered out
-                        len(self.input_buffer[0]) < self.max_input_size):
-                    self.input_buffer[0] += chr(key)
+        else:
+            self.input_buffer = [bytearray(subject.name.encode()), bytearray(subject.teacher.encode())]
 
-                elif key in [curses.KEY_BACKSPACE, 127] and len(self.input_buffer[0]) > 0:
-                    self.input_buffer[0] = self.input_buffer[0][:-1]
+    def load_period_times_input(self) -> None:
+        """
+        Fills the input buffer with the period times entered so far, so they aren't lost when moving between states.
 
-            elif self.list_items[self.selected_list_item][2] == "periods":
-                if ord('3') <= key <= ord('6') and len(self.input_buffer[1]) < 1:
-                    self.input_buffer[1] += chr(key)
+        Starts with empty times if the number of periods has changed.
 
-                elif key in [curses.KEY_BACKSPACE, 127] and len(self.input_buffer[1]) > 0:
-                    self.input_buffer[1] = self.input_buffer[1][:-1]
+        :return:
+        """
 
-        elif self.list_items[self.selected_list_item][1] == "period_zero":
-            if key in [ord("y"), ord("Y")]:
-                self.include_period_zero = True
+        if len(self.period_times) == self.num_periods:
+            self.input_buffer = [bytearray(time_text.encode())
+                                 for period_time in self.period_times.values()
+                                 for time_text in (period_time.start_time, period_time.end_time)]
 
-            elif key in [ord("n"), ord("N")]:
-                self.include_period_zero = False
+        else:
+            self.input_buffer = [bytearray() for _ in range(2 * self.num_periods)]
 
-    def process_input_creating_period_times(self, key: int) -> None:
-        if key in [curses.KEY_ENTER, ord("\n")]:
-            if self.list_items[self.selected_list_item][1] == "Back":
-                self.input_buffer = [self.timetable_name, str(self.num_periods)]
-                self.selected_list_item = 0
+    def redraw(self) -> None:
+        """
+        Marks the whole menu to be redrawn, rebuilding the list items as the state may have changed.
 
-                self.state = 0
+        :return None:
+        """
 
-            elif self.list_items[self.selected_list_item][1] == "Next":
-                self.process_period_times()
+        super().redraw()
+        self.list_items_changed = True
 
-                self.input_buffer = []
-                self.selected_list_item = 0
+    # Input Processing
 
-                self.state = 2
+    def process_input_basic_info(self, key: int) -> None:
+        item: tuple = self.list_items[self.selected_list_item]
 
-        elif key == 27:
-            self.input_buffer = [self.timetable_name, str(self.num_periods)]
-            self.selected_list_item = 0
+        if key in ENTER_KEYS:
+            if item[1] == "Back":
+                self.enter_state(-1)
 
-            self.state = 0
+            elif item[1] == "Next":
+                if len(self.input_buffer[0]) == 0:
+                    popup_window = TempPopupWindow("Please enter a name for the timetable.", self.stdscreen)
+                    popup_window.display()
 
-        elif key == curses.KEY_UP:
-            self.navigate_list(-1)
+                elif len(self.input_buffer[1]) == 0:
+                    popup_window = TempPopupWindow("Please select the number of periods", self.stdscreen)
+                    popup_window.display()
 
-        elif key == curses.KEY_DOWN:
-            self.navigate_list(1)
+                else:
+                    self.timetable_name = self.input_buffer[0].decode()
+                    self.num_periods = int(self.input_buffer[1])
 
-        elif self.list_items[self.selected_list_item][1] == "editor":
-            start_index: int = self.selected_list_item // 3
+                    self.enter_state(1)
 
-            if self.list_items[self.selected_list_item][2] == "start":
-                if ord('0') <= key <= ord('9') and len(self.input_buffer[2 * start_index]) < 4:
-                    self.input_buffer[2 * start_index] += chr(key)
+        elif key == 27:
+            self.enter_state(-1)
 
-                elif key in [curses.KEY_BACKSPACE, 127] and len(self.input_buffer[2 * start_index]) > 0:
-                    self.input_buffer[2 * start_index] = self.input_buffer[2 * start_index][:-1]
+        elif item[1] == "editor":
+            if item[2] == "name":
+                if key in TIMETABLE_NAME_KEYS and len(self.input_buffer[0]) < self.max_input_size:
+                    self.input_buffer[0].append(key)
+                    self.list_items_changed = True
 
-            elif self.list_items[self.selected_list_item][2] == "end":
-                if ord('0') <= key <= ord('9') and len(self.input_buffer[2 * start_index + 1]) < 4:
-                    self.input_buffer[2 * start_index + 1] += chr(key)
+                elif key in BACKSPACE_KEYS and len(self.input_buffer[0]) > 0:
+                    del self.input_buffer[0][-1]
+                    self.list_items_changed = True
 
-                elif key in [curses.KEY_BACKSPACE, 127] and len(self.input_buffer[2 * start_index + 1]) > 0:
-                    self.input_buffer[2 * start_index + 1] = self.input_buffer[2 * start_index + 1][:-1]
+            elif item[2] == "periods":
+                if key in PERIOD_COUNT_KEYS and len(self.input_buffer[1]) < 1:
+                    self.input_buffer[1].append(key)
+                    self.list_items_changed = True
 
-    def process_input_viewing_subjects(self, key: int) -> None:
-        if key in [curses.KEY_ENTER, ord("\n")]:
-            if self.list_items[self.selected_list_item][1] == "Back":
-                self.input_buffer = []
+                elif key in BACKSPACE_KEYS and len(self.input_buffer[1]) > 0:
+                    del self.input_buffer[1][-1]
+                    self.list_items_changed = True
 
-                for _ in range(self.num_periods):
-                    self.input_buffer.append("")
-                    self.input_buffer.append("")
+        elif item[1] == "period_zero":
+            if key in YES_KEYS:
+                self.include_period_zero = True
+                self.list_items_changed = True
 
-                self.selected_list_item = 0
+            elif key in NO_KEYS:
+                self.include_period_zero = False
+                self.list_items_changed = True
 
-                self.state = 1
+    def process_input_creating_period_times(self, key: int) -> None:
+        item: tuple = self.list_items[self.selected_list_item]
 
-            elif self.list_items[self.selected_list_item][1] == "New":
-                self.input_buffer = [
-                    "",
-                    ""
-                ]
+        if key in ENTER_KEYS:
+            if item[1] == "Back":
+                self.enter_state(0)
 
-                self.selected_list_item = 0
+            elif item[1] == "Next":
+                self.enter_state(2)
+
+        elif key == 27:
+            self.enter_state(0)
 
-                new_id: str = str(randint(0, 9999999999))
+        elif item[1] == "editor":
+            # Start and end buffers sit next to each other for every period
+            time_buffer: bytearray = self.input_buffer[2 * (self.selected_list_item // 3) + (item[2] == "end")]
 
-                while self.subjects.get(new_id) is not None:
-                    new_id = str(randint(0, 9999999999))
+            if key in DIGIT_KEYS and len(time_buffer) < 4:
+                time_buffer.append(key)
+                self.list_items_changed = True
 
-                self.subject_editing_id = new_id
+            elif key in BACKSPACE_KEYS and len(time_buffer) > 0:
+                del time_buffer[-1]
+                self.list_items_changed = True
 
-                self.state = 3
+    def process_input_viewing_subjects(self, key: int) -> None:
+        item: tuple = self.list_items[self.selected_list_item]
 
-            elif self.list_items[self.selected_list_item][1] == "Create":
+        if key in ENTER_KEYS:
+            if item[1] == "Back":
+                self.enter_state(1)
+
+            elif item[1] == "New":
+                self.subject_editing_id = str(self.next_subject_id)
+                self.next_subject_id += 1
+
+                self.enter_state(3)
+
+            elif item[1] == "Create":
                 if len(self.subjects) == 0:
                     popup_window = TempPopupWindow("Create at least one subject to proceed.", self.stdscreen)
                     popup_window.display()
@@ -1171,151 +1574,120 @@ class TimetableCreatorMenu(Menu):
                     timetable_view_menu.display()
 
             else:
-                self.subject_editing_id = list(self.subjects.keys())[self.selected_list_item]
+                # The selected list item holds the subject itself, so there is no need to look up its ID
+                subject: Subject = item[1]
 
-                self.input_buffer = [
-                    self.subjects[self.subject_editing_id].name,
-                    self.subjects[self.subject_editing_id].teacher
-                ]
+                self.subject_editing_id = subject.subject_id
 
-                self.state = 3
+                self.enter_state(3)
 
         if key == 27:
-            self.input_buffer = []
-
-            for _ in range(self.num_periods):
-                self.input_buffer.append("")
-                self.input_buffer.append("")
-
-            self.selected_list_item = 0
-
-            self.state = 1
-
-        elif key == curses.KEY_UP:
-            self.navigate_list(-1)
-
-        elif key == curses.KEY_DOWN:
-            self.navigate_list(1)
+            self.enter_state(1)
 
     def process_input_editing_subject(self, key: int) -> None:
-        if key in [curses.KEY_ENTER, ord("\n")]:
-            if self.list_items[self.selected_list_item][1] == "Delete" and self.subject_editing_id is not None:
-                if self.subjects.get(self.subject_editing_id) is not None:
-                    del self.subjects[self.subject_editing_id]
+        item: tuple = self.list_items[self.selected_list_item]
 
-                self.input_buffer = []
-                self.selected_list_item = 0
-                self.state = 2
+        if key in ENTER_KEYS:
+            if item[1] == "Delete" and self.subject_editing_id is not None:
+                self.subjects.pop(self.subject_editing_id, None)
 
-            elif self.list_items[self.selected_list_item][1] == "Save" and self.subject_editing_id is not None:
-                if self.input_buffer[0] == "":
+                self.enter_state(2)
+
+            elif item[1] == "Save" and self.subject_editing_id is not None:
+                if len(self.input_buffer[0]) == 0:
                     popup_window = TempPopupWindow("Please enter a name for the period.", self.stdscreen)
                     popup_window.display()
 
                     return
 
-                new_subject = Subject(self.subject_editing_id, self.input_buffer[0], self.input_buffer[1])
+                new_subject = Subject(self.subject_editing_id,
+                                      self.input_buffer[0].decode(),
+                                      self.input_buffer[1].decode())
 
                 self.subjects[self.subject_editing_id] = new_subject
 
-                self.input_buffer = []
-                self.selected_list_item = 0
-
-                self.state = 2
-
-            elif self.list_items[self.selected_list_item][1] == "Back":
-                self.input_buffer = []
-                self.selected_list_item = 0
+                self.enter_state(2)
 
-                self.state = 2
+            elif item[1] == "Back":
+                self.enter_state(2)
 
         elif key == 27:
-            self.selected_list_item = 0
-            self.state = 2
+            self.enter_state(2)
 
-        elif key == curses.KEY_UP:
-            self.navigate_list(-1)
+        elif item[1] == "editor":
+            subject_buffer: bytearray = self.input_buffer[SUBJECT_FIELD_BUFFERS[item[2]]]
 
-        elif key == curses.KEY_DOWN:
-            self.navigate_list(1)
-
-        elif self.list_items[self.selected_list_item][1] == "editor":
-            if self.list_items[self.selected_list_item][2] == "name":
-                if ((ord('!') <= key <= ord('~') or key == ord(' ')) and
-                        len(self.input_buffer[0]) < self.max_input_size):
-                    self.input_buffer[0] += chr(key)
-
-                elif key in [127, curses.KEY_BACKSPACE] and len(self.input_buffer[0]) > 0:
-                    self.input_buffer[0] = self.input_buffer[0][:-1]
+            if key in PRINTABLE_KEYS and len(subject_buffer) < self.max_input_size:
+                subject_buffer.append(key)
+                self.list_items_changed = True
 
-            elif self.list_items[self.selected_list_item][2] == "teacher":
-                if ((ord('!') <= key <= ord('~') or key == ord(' ')) and
-                        len(self.input_buffer[1]) < self.max_input_size):
-                    self.input_buffer[1] += chr(key)
-
-                elif key in [curses.KEY_BACKSPACE, 127] and len(self.input_buffer[1]) > 0:
-                    self.input_buffer[1] = self.input_buffer[1][:-1]
+            elif key in BACKSPACE_KEYS and len(subject_buffer) > 0:
+                del subject_buffer[-1]
+                self.list_items_changed = True
 
     def process_input(self, key: int) -> None:
-        if key in [ord('q'), ord('Q')] and self.editing is False:
+        if key in QUIT_KEYS and self.editing is False:
             raise ExitCurses("Exiting")
 
-        if self.state == 0:
-            self.process_input_basic_info(key)
-
-        elif self.state == 1:
-            self.process_input_creating_period_times(key)
+        # Selecting an item or going back can change anything on screen, including drawing a popup over it
+        if key in ENTER_KEYS or key == 27 or key == curses.KEY_RESIZE:
+            self.redraw()
 
-        elif self.state == 2:
-            self.process_input_viewing_subjects(key)
+        # Moving through the list works the same way in every state
+        if key in LIST_NAVIGATION_KEYS:
+            self.navigate_list(LIST_NAVIGATION_KEYS[key])
+            return
 
-        elif self.state == 3:
-            self.process_input_editing_subject(key)
+        # Process input based on state
+        input_handler: Callable[[int], None] | None = self.input_handlers.get(self.state)
 
-        else:
+        if input_handler is None:
             raise ExitCurses("Invalid state")
 
+        input_handler(key)
+
     # Displaying Windows
 
     def display_basic_info(self) -> None:
-        self.list_items = [
-            (f"Timetable Name: {self.input_buffer[0]}", "editor", "name"),
-            (f"Number of Periods per Day (3 - 6): {self.input_buffer[1]}", "editor", "periods"),
-            (f"Include Period Zero (y/n): {'y' if self.include_period_zero else 'n'}", "period_zero"),
-            ("Next", "Next"),
-            ("Back", "Back"),
-        ]
+        if self.list_items_changed:
+            self.list_items = [
+                (f"Timetable Name: {self.input_buffer[0].decode()}", "editor", "name"),
+                (f"Number of Periods per Day (3 - 6): {self.input_buffer[1].decode()}", "editor", "periods"),
+                (f"Include Period Zero (y/n): {'y' if self.include_period_zero else 'n'}", "period_zero"),
+                ("Next", "Next"),
+                ("Back", "Back"),
+            ]
 
         self.display_list()
 
         self.shortcut_info = "Shortcuts: [esc] Back, [q] Quit, [return] Select"
 
     def display_creating_period_times(self) -> None:
-        self.list_items = []
-
-        start_index: int = int(not self.include_period_zero)
-
-        for i in range(self.num_periods):
-            self.list_items.append((f"Period {i + start_index}", "title"))
-            self.list_items.append((f"Start Time: {self.input_buffer[2 * i]}", "editor", "start"))
-            self.list_items.append((f"End Time: {self.input_buffer[2 * i + 1]}", "editor", "end"))
-
-        self.list_items.append(("Next", "Next"))
-        self.list_items.append(("Back", "Back"))
+        if self.list_items_changed:
+            start_index: int = int(not self.include_period_zero)
+
+            # Builds the title, start time and end time rows of every period in one list
+            self.list_items = [
+                row
+                for i in range(self.num_periods)
+                for row in (
+                    (f"Period {i + start_index}", "title"),
+                    (f"Start Time: {self.input_buffer[2 * i].decode()}", "editor", "start"),
+                    (f"End Time: {self.input_buffer[2 * i + 1].decode()}", "editor", "end")
+                )
+            ]
+
+            self.list_items.extend((("Next", "Next"), ("Back", "Back")))
 
         self.display_list()
 
         self.shortcut_info = "Shortcuts: [esc] Back, [q] Quit, [return] Select"
 
     def display_viewing_subjects(self) -> None:
-        self.list_items = []
+        if self.list_items_changed:
+            self.list_items = [(str(subject), subject) for subject in self.subjects.values()]
 
-        for subject in self.subjects.values():
-            self.list_items.append((str(subject), subject))
-
-        self.list_items.append(("Create New Subject", "New"))
-        self.list_items.append(("Create Timetable", "Create"))
-        self.list_items.append(("Back", "Back"))
+            self.list_items.extend((("Create New Subject", "New"), ("Create Timetable", "Create"), ("Back", "Back")))
 
         self.display_list()
 
@@ -1326,15 +1698,14 @@ class TimetableCreatorMenu(Menu):
             self.shortcut_info = "Shortcuts: [esc] Back, [q] Quit, [return] Select"
 
     def display_editing_subject(self) -> None:
-        self.list_items = []
-
-        self.list_items = [
-            (f"Name: {self.input_buffer[0]}", "editor", "name"),
-            (f"Teacher: {self.input_buffer[1]}", "editor", "teacher"),
-            ("Delete", "Delete"),
-            ("Save and Exit", "Save"),
-            ("Back", "Back"),
-        ]
+        if self.list_items_changed:
+            self.list_items = [
+                (f"Name: {self.input_buffer[0].decode()}", "editor", "name"),
+                (f"Teacher: {self.input_buffer[1].decode()}", "editor", "teacher"),
+                ("Delete", "Delete"),
+                ("Save and Exit", "Save"),
+                ("Back", "Back"),
+            ]
 
         self.display_list()
 
@@ -1343,39 +1714,47 @@ class TimetableCreatorMenu(Menu):
     def display(self) -> None:
         self.panel.top()
         self.panel.show()
-        self.window.clear()
 
-        while True:
-            self.window.clear()
+        # The window never changes while the menu is open, so its methods are looked up once
+        window: curses.window = self.window
+        window.clear()
 
+        while True:
             if self.state == -1:
                 self.exit()
                 return
 
-            if self.state == 0:
-                self.display_basic_info()
+            # Only redraws the menu if something on it has changed since the last key
+            if self.dirty or self.list_items_changed:
+                # Clears the window when everything needs redrawing, otherwise only changed rows are drawn over
+                if self.drawn_rows is None:
+                    window.clear()
 
-            elif self.state == 1:
-                self.display_creating_period_times()
+                self.display_handlers[self.state]()
 
-            elif self.state == 2:
-                self.display_viewing_subjects()
+                self.title = f"{self.states.get(self.state)} | Creating Timetable"
 
-            elif self.state == 3:
-                self.display_editing_subject()
+                if self.editing:
+                    self.shortcut_info = "(Editing)"
 
-            self.title = f"{self.states.get(self.state)} | Creating Timetable"
+                for y, text in ((0, self.title), (self.height - 1, self.shortcut_info)):
+                    window.move(y, 2)
+                    window.clrtoeol()
+                    window.addstr(y, 2, text)
 
-            if self.editing:
-                self.shortcut_info = "(Editing)"
+                window.refresh()
 
-            self.window.addstr(0, 2, self.title)
-            self.window.addstr(self.height - 1, 2, self.shortcut_info)
-            self.window.refresh()
+                self.dirty = False
+                self.list_items_changed = False
 
-            key = self.window.getch()
+            key = window.getch()
+
+            # Keys waiting behind this one are only processed if it doesn't change the state or selected item
+            state: int = self.state
+            selected_list_item: int = self.selected_list_item
 
             self.process_input(key)
+            self.process_pending_input(state, selected_list_item)
 
 
 class App:
@@ -1393,6 +1772,9 @@ class App:
         # Timetable to use
         self.current_timetable: Timetable | None = None
 
+        # The data read from each file and the version of the file it came from, so unchanged files aren't parsed again
+        self.file_cache: dict[str, tuple[tuple[int, int, int], dict | None]] = {}
+
         # Curses window instance to use
         self.screen: curses.window = stdscreen
 
@@ -1400,13 +1782,10 @@ class App:
         curses.curs_set(0)
 
         # Color initialization
-        curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)
-        curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_BLUE)
-        curses.init_pair(3, curses.COLOR_WHITE, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_RED, curses.COLOR_WHITE)
+        self.init_colors()
 
         # Set background color
-        stdscreen.bkgd(' ', curses.color_pair(2))
+        stdscreen.bkgd(' ', CP_BACKGROUND)
 
         # Check the data/ directory exists, if not create one
         self.check_data_dir()
@@ -1421,12 +1800,13 @@ class App:
 
             self.open_file(file)
 
-        # Search the data/ directory for .json files
-        files = glob.glob(f"{data_dir}/*.json")
-        file_items = []
-        for file in files:
-            file_name: str = Path(file).stem
-            file_items.append((file_name, self.open_file, file))
+        # Search the data/ directory for .json files, skipping hidden files like glob does
+        with os.scandir(data_dir) as entries:
+            file_items: list[tuple] = [
+                (entry.name.removesuffix(".json"), self.open_file, entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+            ]
 
         # No .json files found
         if len(file_items) == 0:
@@ -1445,6 +1825,28 @@ class App:
         main_menu = QuickListMenu("Open an existing timetable or create a new one", main_menu_items, self.screen)
         main_menu.display()
 
+    @staticmethod
+    def init_colors() -> None:
+        """
+        Initializes the color pairs, and caches their attributes for use when drawing.
+
+        :return:
+        """
+
+        global CP_NORMAL, CP_BACKGROUND, CP_HIGHLIGHT, CP_HEADER, CP_SELECTED
+
+        curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)
+        curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_BLUE)
+        curses.init_pair(3, curses.COLOR_WHITE, curses.COLOR_BLACK)
+        curses.init_pair(4, curses.COLOR_RED, curses.COLOR_WHITE)
+
+        CP_NORMAL = curses.color_pair(1)
+        CP_BACKGROUND = curses.color_pair(2)
+        CP_HIGHLIGHT = curses.color_pair(3)
+        CP_HEADER = curses.color_pair(4)
+
+        CP_SELECTED = curses.A_REVERSE | CP_NORMAL
+
     @staticmethod
     def check_data_dir() -> None:
         """
@@ -1456,6 +1858,20 @@ class App:
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
 
+    @staticmethod
+    def check_string(value) -> str:
+        """
+        Checks that a value loaded from a file is a string, as JSON allows any type, including null.
+
+        :param value: The value to check.
+        :return: The value, if it is a string.
+        """
+
+        if not isinstance(value, str):
+            raise TypeError(f"Expected a string, got {type(value).__name__}")
+
+        return value
+
     def load_file(self, filename: str) -> None:
         """
         Loads a JSON file from the given path, and turns it into a Timetable object.
@@ -1464,70 +1880,65 @@ class App:
         :return:
         """
 
-        # Uses the JSON module to load data into python objects
-        with open(filename) as f:
+        # Identifies the version of the file, as the modified time alone may not change if it is edited within the
+        # same timestamp tick, while the size or the file itself (replaced when saved) usually does
+        file_stat: os.stat_result = os.stat(filename)
+        file_version: tuple[int, int, int] = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+        cached_data: tuple[tuple[int, int, int], dict | None] | None = self.file_cache.get(filename)
+
+        # Reuses the data from the last time the file was loaded if it hasn't changed since
+        if cached_data is not None and cached_data[0] == file_version:
+            json_data: dict | None = cached_data[1]
+
+        else:
+            # Reads the whole file as bytes and lets the JSON module decode it in one pass
+            with open(filename, "rb") as f:
+                raw_data: bytes = f.read()
+
+            # Uses the JSON module to load data into python objects
             try:
-                json_data: dict | None = json.load(f)
-            except json.decoder.JSONDecodeError as exception:
+                json_data = json.loads(raw_data)
+            except (json.decoder.JSONDecodeError, UnicodeDecodeError) as exception:
                 raise InvalidDataException("Invalid JSON") from exception
 
+            self.file_cache[filename] = (file_version, json_data)
+
         if json_data is None:
             raise InvalidDataException("No data found!")
 
-        # Tries to extract timetable data from the json data
+        # Tries to build the timetable data straight from the json data
         try:
-            timetable_name: str = json_data["name"]
-            timetable_raw: list[dict[str, dict[str, str]]] = json_data["timetable"]
-            subjects_raw: dict[str, dict[str, str]] = json_data["subjects"]
-            period_times_raw: dict[str, dict[str, str]] = json_data["period_times"]
-
-        # Occurs if there is a missing field in the JSON data
+            timetable_name: str = self.check_string(json_data["name"])
+
+            # Text fields are checked to be strings, as anything else would only fail once it is drawn
+            subjects: dict[str, Subject] = {
+                subject_id: Subject(subject_id,
+                                    self.check_string(subject_raw["name"]),
+                                    self.check_string(subject_raw["teacher"]))
+                for subject_id, subject_raw in json_data["subjects"].items()
+            }
+
+            # Rooms are usually repeated across many periods, so each distinct room is only kept once
+            periods: dict[int, dict[str, Period]] = {
+                i: {period_id: Period(subjects[period_raw["subject"]], sys.intern(period_raw["room"]))
+                    for period_id, period_raw in day.items()}
+                for i, day in enumerate(json_data["timetable"])
+            }
+
+            period_times: dict[str, PeriodTimeStruct] = {
+                period_num: PeriodTimeStruct(self.check_string(period_time_raw["name"]),
+                                             self.check_string(period_time_raw["start"]),
+                                             self.check_string(period_time_raw["end"]))
+                for period_num, period_time_raw in json_data["period_times"].items()
+            }
+
+        # Occurs if there is a missing field in the JSON data, or a period uses a subject that doesn't exist
         except KeyError as exception:
-            raise InvalidDataException("Invalid configuration (Missing Data)") from exception
-
-        # Creating subject objects
-        subjects: dict[str, Subject] = {}
-        for subject_id, subject_raw in subjects_raw.items():
-            name: str | None = subject_raw.get("name")
-            teacher: str | None = subject_raw.get("teacher")
-
-            if name is None or teacher is None:
-                raise InvalidDataException(f"{subject_id} has no name or teacher")
-
-            subjects[subject_id] = Subject(subject_id, name, teacher)
-
-        # Creating timetable of periods
-        periods: dict[int, dict[str, Period]] = {}
-        for i, day in enumerate(timetable_raw):
-            periods[i] = {}
-            for period_id, val in day.items():
-                subject_id: str | None = val.get("subject")
-
-                if subject_id is None:
-                    raise InvalidDataException("No subject ID found")
-
-                subject: Subject | None = subjects.get(subject_id)
-                room: str | None = val.get("room")
-
-                if subject is None or room is None:
-                    raise InvalidDataException(f"{period_id} has no subject or room for day {day}")
-
-                period: Period = Period(subject, room)
-
-                periods[i][period_id] = period
-
-        # Creating period time objects
-        period_times: dict[str, PeriodTimeStruct] = {}
-        for period_num, period_time_data in period_times_raw.items():
-            name: str | None = period_time_data.get("name")
-            start_time: str | None = period_time_data.get("start")
-            end_time: str | None = period_time_data.get("end")
-
-            if name is None or start_time is None or end_time is None:
-                raise InvalidDataException(f"Period {period_num} is missing data")
+            raise InvalidDataException(f"Invalid configuration (Missing {exception})") from exception
 
-            period_time_struct = PeriodTimeStruct(name, start_time, end_time)
-            period_times[period_num] = period_time_struct
+        # Occurs if part of the JSON data isn't the expected type, such as a list instead of an object or null text
+        except (TypeError, AttributeError) as exception:
+            raise InvalidDataException("Invalid configuration (Wrong Data Type)") from exception
 
         # Creates Timetable
         self.current_timetable = Timetable(periods, subjects, period_times, timetable_name, filename)